@@ -346,20 +346,23 @@ def get_all_mentors_in_yml_format(yml_file_path, xlsx_file_path, skip_rows=0):
     if not df_yml.empty:
         new_index = df_yml['Index'].max().item() + 1
 
+    # Index current mentors by name once, instead of filtering df_yml for every Excel row
+    yml_mentors_by_name = {yml_mentor.Name: yml_mentor for yml_mentor in df_yml.itertuples(index=False)}
+
     mentors = []
 
     for row in range(0, len(df_mentors)):
         mentor_name = df_mentors.iloc[row].values[2].strip().lower()
 
-        df_yml_row = df_yml.loc[df_yml.Name == mentor_name]
+        yml_mentor = yml_mentors_by_name.get(mentor_name)
 
-        if not df_yml_row.empty:
+        if yml_mentor is not None:
             mentor = xlsx_to_yaml_parser(df_mentors.iloc[row],
-                                        df_yml_row['Index'].item(),
-                                        df_yml_row['Disabled'].item(),
-                                        df_yml_row['Sort'].item(),
-                                        df_yml_row['Matched'].item(),
-                                        df_yml_row['Num_mentee'].item())
+                                        yml_mentor.Index,
+                                        yml_mentor.Disabled,
+                                        yml_mentor.Sort,
+                                        yml_mentor.Matched,
+                                        yml_mentor.Num_mentee)
             logging.info(f"For {mentor_name} use index, disabled and sort from mentors.yml file")
         else:
             mentor = xlsx_to_yaml_parser(df_mentors.iloc[row],
@@ -389,6 +392,7 @@ def get_new_mentors_in_yml_format(yml_file_path, xlsx_file_path, skip_rows=1):
 
     if not df_yml.empty:
         new_index = df_yml['Index'].max().item() + 1
+        yml_mentor_names = set(df_yml.Name)
 
         for row in range(0, len(df_mentors)):
             if df_mentors.iloc[row].isnull().all():
@@ -396,7 +400,7 @@ def get_new_mentors_in_yml_format(yml_file_path, xlsx_file_path, skip_rows=1):
 
             mentor_name = df_mentors.iloc[row].values[2].strip().lower()
 
-            if df_yml.loc[df_yml.Name == mentor_name].empty:
+            if mentor_name not in yml_mentor_names:
                 mentor = xlsx_to_yaml_parser(df_mentors.iloc[row], new_index)
                 new_index += 1
                 mentors.append(mentor)
@@ -1,7 +1,10 @@
 import pandas as pd
 import os
 import re
-import copy  # Import copy module for deep copying
+
+# Patterns for splitting a mentee's mentor selections, compiled once instead of per row
+MENTOR_ENTRY_SPLIT_RE = re.compile(r"\n|\d+[.-]\s*")
+MENTOR_REASON_RE = re.compile(r"^([^\-\n]+)\s*-?\s*(.*)$")
 
 def process_mentees(file_path, sheet_name, output_dir):
     """Processes the mentee registration data and generates Excel files for each mentor."""
@@ -37,10 +40,12 @@ def process_mentees(file_path, sheet_name, output_dir):
     mentor_column = "Which is the mentor's name would you like to be matched with?\nMake sure the name of the mentor is in WCC active mentors here.\n(Note: you can indicate interest for up to five mentors) in the respective priority you would like to be matched\n1. Full Name\n2. Full Name\n3. Full Name\n4. Full Name\n5. Full Name"
     mentor_dict = {}  # Dictionary to store mentees grouped by mentor
 
-    for _, row in df.iterrows():  # Iterate through each row in the DataFrame
-        mentee_data = row[columns_to_keep].to_dict()  # Extract mentee's details as a dictionary
-        if pd.notna(row[mentor_column]):  # Check if the mentor column is not empty
-            mentor_entries = re.split(r"\n|\d+[.-]\s*", str(row[mentor_column]))  # Split multiple mentor entries into a list
+    # Extract every mentee's details as dictionaries in one pass instead of row by row
+    mentee_records = df[columns_to_keep].to_dict("records")
+
+    for mentee_data, mentor_selection in zip(mentee_records, df[mentor_column]):
+        if pd.notna(mentor_selection):  # Check if the mentor column is not empty
+            mentor_entries = MENTOR_ENTRY_SPLIT_RE.split(str(mentor_selection))  # Split multiple mentor entries into a list
             mentors = []
             reasons = {}  # Dictionary to store mentor-specific reasons
 
@@ -50,7 +55,7 @@ def process_mentees(file_path, sheet_name, output_dir):
                     continue
 
                 # Extract mentor name and reason (if any)
-                match = re.match(r"^([^\-\n]+)\s*-?\s*(.*)$", entry)
+                match = MENTOR_REASON_RE.match(entry)
                 if match:
                     mentor_name = match.group(1).strip()
                     entry_reason = match.group(2).strip()
@@ -63,7 +68,7 @@ def process_mentees(file_path, sheet_name, output_dir):
                     reasons[entry] = ""
 
             for mentor_name in mentors:
-                mentee_copy = copy.deepcopy(mentee_data)  # Create a separate copy for each mentor
+                mentee_copy = dict(mentee_data)  # Shallow copy is enough: the values are scalars, only the reason is replaced
                 mentee_copy["Why do you believe these mentor(s) can help you achieve your goals this year?\n\nPlease include which aspects of the mentor’s profile interest you the most and how they align with the skills the mentor offers and the ones you are also interested in developing."] = reasons[mentor_name]
 
                 if mentor_name not in mentor_dict:
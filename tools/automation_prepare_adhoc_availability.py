@@ -66,18 +66,12 @@ def get_availability_update_dict(available_mentors):
        Returns a dictionary mapping mentor to their available hours (from spreadsheet file)
        - If hours column in spreadsheet is empty/non-numeric, the value will be None (indicating existing hours should be kept)
     """
-    availability_update_dict = {}
+    mentor_names = available_mentors['Mentor Name'].str.strip()
+    updated_hours = available_mentors['Availability (Hours)'].astype(object)
 
-    for _, row in available_mentors.iterrows():
-        mentor_name = row['Mentor Name'].strip()
-        updated_hours = row['Availability (Hours)']
+    keep_existing_hours = updated_hours.isna() | updated_hours.astype(str).str.strip().eq("")
 
-        if pd.isna(updated_hours) or str(updated_hours).strip() == "":
-            availability_update_dict[mentor_name] = None
-        else:
-            availability_update_dict[mentor_name] = updated_hours
-
-    return availability_update_dict
+    return dict(zip(mentor_names, updated_hours.where(~keep_existing_hours, None)))
 
 
 def update_mentor_availability(month, xlsx_file_path, yml_file_path):
@@ -14,6 +14,24 @@ from ics import Calendar
 CODING_CLUB_BANNER = "/assets/images/events/event-coding-club-3.jpg"
 WRITING_CLUB_BANNER = "/assets/images/events/event-writing-club.jpeg"
 
+# Existing events are only read to collect their keys, so use libyaml's C loader when it is available
+YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Shared HTTP session so event page scrapes reuse the connection to meetup.com
+HTTP_SESSION = requests.Session()
+
+# ----- Patterns used to clean event descriptions, compiled once at import -----
+MARKDOWN_EMPHASIS_RE = re.compile(r'[*_~`]+')
+MARKDOWN_LINK_RE = re.compile(r'\[([^\]]+)\]\([^)]+\)')
+PERSON_LINE_RE = re.compile(r'\**(?P<role>Host|Co-host|Guest Presenter|Speaker):\**\s*(?P<name>.+)', re.IGNORECASE)
+DESCRIPTION_ALLOWED_CHARS = frozenset(
+    "abcdefghijklmnopqrstuvwxyz"
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    "0123456789"
+    " \t\n\r"
+    ".,;:!?'\"-()’"
+)
+
 # ----- YAML formatting classes -----
 class LiteralString(str): pass
 class QuotedString(str): pass
@@ -74,9 +92,9 @@ class MeetupEvents(BaseModel):
 
 # ----- Helper function to clean bold/italics markdown from a name -----
 def clean_name(s):
-    s = re.sub(r'[*_~`]+', '', s)
+    s = MARKDOWN_EMPHASIS_RE.sub('', s)
     s = s.strip()
-    s = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', s)
+    s = MARKDOWN_LINK_RE.sub(r'\1', s)
     if '|' in s:
         s = s.split('|')[0].strip()
     return s
@@ -93,26 +111,22 @@ def get_hosts_and_speakers(event_desc: str) -> tuple[str, str]:
     for line in lines:
         line = line.strip()
 
-        host_match = re.match(r'\**Host:\**\s*(.+)', line, re.IGNORECASE)
-        if host_match:
-            host_name = clean_name(host_match.group(1))
-            if host_name:
-                hosts.append(host_name)
+        # One match per line finds the role (host, co-host or speaker) and the name together
+        person_match = PERSON_LINE_RE.match(line)
+        if not person_match:
             continue
 
-        cohost_match = re.match(r'\**Co-host:\**\s*(.+)', line, re.IGNORECASE)
-        if cohost_match:
-            cohost_name = clean_name(cohost_match.group(1))
-            if cohost_name:
-                cohosts.append(cohost_name)
+        name = clean_name(person_match.group('name'))
+        if not name:
             continue
 
-        speaker_match = re.match(r'\**(Guest Presenter|Speaker):\**\s*(.+)', line, re.IGNORECASE)
-        if speaker_match:
-            speaker_name = clean_name(speaker_match.group(2))
-            if speaker_name:
-                speakers.append(speaker_name)
-            continue
+        role = person_match.group('role').lower()
+        if role == 'host':
+            hosts.append(name)
+        elif role == 'co-host':
+            cohosts.append(name)
+        else:
+            speakers.append(name)
 
     speaker = ', '.join(speakers)
     host = ""
@@ -128,17 +142,10 @@ def get_hosts_and_speakers(event_desc: str) -> tuple[str, str]:
 
 # ----- Removes all formatting, unicodes, emojis, etc from event description -----
 def clean_description(text: str) -> str:
-    text = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', text)
-    text = re.sub(r'[*_~`]+', '', text)
+    text = MARKDOWN_LINK_RE.sub(r'\1', text)
+    text = MARKDOWN_EMPHASIS_RE.sub('', text)
     text = unicodedata.normalize('NFKD', text)
-    allowed_chars = set(
-        "abcdefghijklmnopqrstuvwxyz"
-        "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
-        "0123456789"
-        " \t\n\r"
-        ".,;:!?'\"-()’"
-    )
-    text = ''.join(ch for ch in text if ch in allowed_chars)
+    text = ''.join(ch for ch in text if ch in DESCRIPTION_ALLOWED_CHARS)
     return text
 
 # ----- Truncates event description to 1st sentence only and removes WCC prefix in sentence -----
@@ -158,7 +165,7 @@ def get_formatted_event_description(event_desc: str) -> str:
 
 # ------ Scrape a single Meetup event page to extract the main image URL ------
 def get_event_image_url(url: str) -> str:
-    response = requests.get(url)
+    response = HTTP_SESSION.get(url)
     soup = BeautifulSoup(response.content, "html.parser")
 
     # Look for the Open Graph image tag first (most reliable)
@@ -175,7 +182,7 @@ def get_event_image_url(url: str) -> str:
 
 
 # --- Main logic using downloaded iCal file ---
-def get_upcoming_meetups_from_ical_file(ical_path: str) -> list[MeetupEvents]:
+def get_upcoming_meetups_from_ical_file(ical_path: str, existing_keys: frozenset[str] = frozenset()) -> list[MeetupEvents]:
     with open(ical_path, "r", encoding="utf-8") as f:
         calendar = Calendar(f.read())
 
@@ -189,6 +196,13 @@ def get_upcoming_meetups_from_ical_file(ical_path: str) -> list[MeetupEvents]:
         date_obj = event.begin.datetime
         expiration = date_obj.strftime("%Y%m%d")
         date = date_obj.strftime("%a, %b %d, %Y").upper()
+
+        # Skip events already in events.yml before scraping their Meetup page for the image
+        event_key = get_event_key({"title": title, "date": date})
+        if event_key in existing_keys:
+            logging.info(f"{event_key} already exists in events.yml")
+            continue
+
         time = event.begin.datetime.strftime("%I:%M %p %Z")
         url = event.url or ""
 
@@ -199,21 +213,23 @@ def get_upcoming_meetups_from_ical_file(ical_path: str) -> list[MeetupEvents]:
         image_url = get_event_image_url(url)
 
         # Categorize event type
+        description_lower = description.lower()
+        title_lower = title.lower()
         category_style = "tech-talk"
         category_name = "Tech Talk"
-        if "coding club" in description.lower():
+        if "coding club" in description_lower:
             category_style = "coding-club"
             category_name = "Coding Club"
-        elif "writing club" in description.lower():
+        elif "writing club" in description_lower:
             category_style = "writing-club"
             category_name = "Writing Club"
-        elif "book club" in title.lower():
+        elif "book club" in title_lower:
             category_style = "book-club"
             category_name = "Book Club"
-        elif "career club" in title.lower():
+        elif "career club" in title_lower:
             category_style = "career-club"
             category_name = "Career Club"
-        elif "career talk" in description.lower():
+        elif "career talk" in description_lower:
             category_style = "career-talk"
             category_name = "Career Talk"
 
@@ -260,7 +276,7 @@ def get_existing_event_keys(events):
 def load_existing_events_from_file(file_path):
     try:
         with open(file_path, "r") as file:
-            return yaml.safe_load(file) or []
+            return yaml.load(file, Loader=YAML_SAFE_LOADER) or []
     except FileNotFoundError:
         return []
     except (IOError, yaml.YAMLError) as e:
@@ -286,10 +302,10 @@ def fetch_events():
     yml_file_path = "../_data/events.yml"
 
     logging.info("Params: iCal URL: %s yml: %s", ical_file_path, yml_file_path)
-    upcoming_events = get_upcoming_meetups_from_ical_file(ical_file_path)
-
     existing_events = load_existing_events_from_file(yml_file_path)
     existing_keys = get_existing_event_keys(existing_events)
+    upcoming_events = get_upcoming_meetups_from_ical_file(ical_file_path, frozenset(existing_keys))
+
     added_events = []
     
     logging.info("Upcoming Meetup Events:")
@@ -0,0 +1,13 @@
+import pandas as pd
+from automation_prepare_adhoc_availability import get_availability_update_dict
+
+
+def test_get_availability_update_dict():
+    df = pd.DataFrame({
+        'Mentor Name': [' Mentor1 Name ', 'Mentor2 Name', 'Mentor3 Name'],
+        'Availability (Hours)': [4, ' ', None],
+    })
+
+    result = get_availability_update_dict(df)
+
+    assert result == {'Mentor1 Name': 4, 'Mentor2 Name': None, 'Mentor3 Name': None}
@@ -0,0 +1,24 @@
+from meetup_import import get_hosts_and_speakers
+
+EVENT_DESCRIPTION = (
+    "Join us for a talk.\n"
+    "**Host:** [Host1 Name](https://www.linkedin.com/in/host1) | WCC\n"
+    "**Co-host:** _Cohost1 Name_\n"
+    "Speaker: Speaker1 Name\n"
+    "Guest Presenter: **Speaker2 Name**\n"
+    "**Host:**\n"
+)
+
+
+def test_get_hosts_and_speakers():
+    host, speaker = get_hosts_and_speakers(EVENT_DESCRIPTION)
+
+    assert host == "Host1 Name and Cohost1 Name"
+    assert speaker == "Speaker1 Name, Speaker2 Name"
+
+
+def test_get_hosts_and_speakers_cohosts_only():
+    host, speaker = get_hosts_and_speakers("Co-host: Cohost1 Name\nCO-HOST: Cohost2 Name")
+
+    assert host == "Cohost1 Name, Cohost2 Name"
+    assert speaker == ""